@@ -9,21 +9,28 @@
 # spacebar queues item -- return fetches
 # see "User/Machine Specific" for destination path
 
-import os, sys, argparse
+import os, sys, argparse, pickle
 import threading, queue
+from concurrent.futures import ThreadPoolExecutor
 import curses
 from curseslistwindow import *
-from configobj import ConfigObj as CfgObj
-from time import sleep
-import urllib.request as urlreq
-from urllib.error import *
+import urllib3
+from urllib3.exceptions import HTTPError
 from urllib.parse import urlencode
-import xml.etree.ElementTree as ET
+from io import BytesIO
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 #~~~ Constants ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 version = '0.4.6'
 ua = 'getnzbs/' + version
 config_file_paths = [ './getnzbs.conf', os.environ['HOME']+'/.config/getnzbs.conf', ]
+config_cache_path = os.environ['HOME']+'/.cache/getnzbs/config.pkl'
+newznab_response = '{http://www.newznab.com/DTD/2010/feeds/attributes/}response'  # <newznab:response total=...>
+item_tags = frozenset(('title', 'pubDate', 'link', 'category'))   # text fields kept from each <item>
+httppool = urllib3.PoolManager(maxsize=16, headers={'User-Agent':ua})  # keep-alive across pages & nzbs
 
 #~~~ Globals ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 results = []        # query results - a list of dicts
@@ -36,9 +43,15 @@ mainwin = None
 footerwin = None
 columns = [4, 1, 0, 22, 11]
 displayqueue = queue.SimpleQueue()
+lastwritten = {}    # header/status/footer text currently on screen
+attr_current = curses.A_BOLD            # row attributes, set from the
+attr_fetched = 0                        #   color pairs in init_screen()
+attr_fetched_current = curses.A_BOLD
+fetchpool = ThreadPoolExecutor(max_workers=4)   # nzb downloads
 
 #~~~ Curses functions ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 def init_screen():
+    global attr_current, attr_fetched, attr_fetched_current
     scr = curses.initscr()
     curses.noecho()
     curses.cbreak()
@@ -53,6 +66,9 @@ def init_screen():
                             curses.COLOR_BLUE)
         curses.init_pair(4, curses.COLOR_YELLOW,
                             curses.COLOR_BLACK)
+        attr_current = curses.color_pair(3) | curses.A_BOLD
+        attr_fetched = curses.color_pair(4)
+        attr_fetched_current = curses.color_pair(2) | curses.A_BOLD
     curses.curs_set(0)
     #curses.mousemask(0x00210002) # BUTTON1_PRESSED | scrollup | scrolldown
     curses.mousemask(curses.ALL_MOUSE_EVENTS)
@@ -62,6 +78,7 @@ def init_screen():
 def divide_screen(scr):
     global headerwin, mainwin, footerwin
     scr.clear()
+    lastwritten.clear()
     headerrows = 2
     footerrows = 1
     maxrows, maxcols = scr.getmaxyx()
@@ -101,6 +118,9 @@ def demolish_screen(scr):
 
 def write_header(message, attr):
     global headerwin
+    if lastwritten.get('header') == (message, attr):
+        return
+    lastwritten['header'] = (message, attr)
     maxcol = headerwin.getmaxyx()[1] - 1
     headerwin.move(0, 0)
     headerwin.clrtoeol()
@@ -112,6 +132,9 @@ def write_status(status):
     """ for debugging purposes only
     """
     global headerwin
+    if lastwritten.get('status') == status:
+        return
+    lastwritten['status'] = status
     maxcol = headerwin.getmaxyx()[1] - 1
     headerwin.move(1, 0)
     headerwin.clrtoeol()
@@ -122,6 +145,9 @@ def write_status(status):
 
 def write_footer(message):
     global footerwin
+    if lastwritten.get('footer') == message:
+        return
+    lastwritten['footer'] = message
     footerline = footerwin.getmaxyx()[0] - 1
     footerwin.addstr(footerline, 5, message)
     footerwin.clrtoeol()
@@ -139,59 +165,173 @@ class NzbHeaderListWindow(MultiColumnListWindow):
 
     def __init__(self, window, data):
         super().__init__(window, data, colwidths=columns)
-        self.fetched = [False for x in range(len(data))]
+        self.fetched = bytearray(len(data))
+        self.active = set()     # indices of nzbs being fetched
+        self.activelock = threading.Lock()
+        self.done_event = threading.Event()     # set when the last fetch finishes
+        self.spinner = None
+
+    def row_status(self, index):
+        """
+        status char and attribute for a row:
+        'X' fetched, '-' queued, ' ' neither
+        """
+        iscurrent = (index == self.current)
+        if self.fetched[index]:
+            return 'X', (attr_fetched_current if iscurrent else attr_fetched)
+        attr = attr_current if iscurrent else 0
+        if self.selected[index]:
+            return '-', attr | curses.A_BOLD
+        return ' ', attr
 
     def write_row(self, index):
         details = self.list[index]
         line = index - self.offset
         if line < 0 or line > (self.line_count - 1):
             return
-        attr = (curses.color_pair(3)|curses.A_BOLD) if (index == self.current) else 0
-        if self.fetched[index]:
-            details[1] = 'X'
-            if index != self.current:
-                attr |= curses.color_pair(4)
-            else:
-                attr = (curses.color_pair(2) | curses.A_BOLD)
-        elif self.selected[index]:
-            details[1] = '-'
-            attr |= curses.A_BOLD
-        else:
-            details[1] = ' '
-        for n in range(self.numcols):
-            self.subwin[n].move(line, 0)
-            self.subwin[n].clrtoeol()
-            if len(details[n]) > self.colwidths[n]:
-                self.subwin[n].insnstr(details[n], self.colwidths[n], attr)
-            elif len(details[n]) > 1:
-                self.subwin[n].insstr(details[n], attr)
+        details[1], attr = self.row_status(index)
+        for (sw, width, text) in zip(self.subwin, self.colwidths, details):
+            sw.move(line, 0)
+            sw.clrtoeol()
+            if len(text) > width:
+                sw.insnstr(text, width, attr)
+            elif len(text) > 1:
+                sw.insstr(text, attr)
             else:
-                self.subwin[n].insch(details[n], attr)
+                sw.insch(text, attr)
+
+    def write_status_cell(self, index):
+        """
+        redraw only the status column of a row;
+        for when nothing else in the row changed
+        """
+        line = index - self.offset
+        if line < 0 or line > (self.line_count - 1):
+            return
+        ch, attr = self.row_status(index)
+        self.list[index][1] = ch
+        self.subwin[1].insch(line, 0, ch, attr)
+        self.subwin[1].noutrefresh()
+
+    def keypress(self, key):
+        if key != ord(' '):
+            return super().keypress(key)
+        index = self.current
+        with self.activelock:   # fetch_done clears selected from a pool thread
+            wasselected = self.selected[index]
+            handled = super().keypress(key)
+            changed = (self.selected[index] != wasselected)
+        if changed:
+            self.write_status_cell(index)
+        return handled
+
+    def resize(self, maxrows, maxcols):
+        """
+        rebuild the column subwindows to fit the parent
+        window's new size; selected, fetched, current &
+        offset are kept.  the title column gets whatever
+        width the fixed columns leave.
+        """
+        edge = 1 if self.drawborder else 0
+        maxrows -= 2 * edge
+        self.line_count = min(self.list_length, maxrows)
+        if self.current - self.offset >= self.line_count:
+            self.offset = self.current - self.line_count + 1
+        if self.offset + self.line_count > self.list_length:
+            self.offset = max(0, self.list_length - self.line_count)
+        # positions & widths come from colwidths, never from the old
+        # subwindows, which mainwin.resize() has already clipped
+        fixed = sum(w for (n, w) in enumerate(self.colwidths) if n != 2)
+        self.colwidths[2] = max(1, maxcols - 2 * edge - fixed)
+        subwin = []
+        x = edge
+        for width in self.colwidths:
+            subwin.append(self.win.derwin(max(1, maxrows), width, edge, x))
+            x += width
+        self.subwin = subwin
+        if self.drawborder:
+            self.win.box()
+        self.win.noutrefresh()
 
     def new_data(self, data):
         self.list = data
         self.list_length = len(data)
-        self.selected = [False for x in range(self.list_length)]
-        self.fetched = [False for x in range(len(data))]
+        self.selected = bytearray(self.list_length)
+        self.fetched = bytearray(self.list_length)
         maxrows = self.win.getmaxyx()[0]
         if self.drawborder:
             maxrows -= 2
         self.line_count = min(self.list_length, maxrows)
 
-    def write_status_spinner(self, index, thread):
+    def start_spinner(self, indices):
+        """
+        add rows to the active set, and start
+        the spinner thread if it isn't running
+        """
+        with self.activelock:
+            self.active.update(indices)
+            if self.active and self.spinner is None:
+                self.spinner = threading.Thread(target=self.write_status_spinner)
+                self.spinner.start()
+
+    def write_status_spinner(self):
+        """
+        one thread animates every active row,
+        exiting once the active set is empty
+        """
         i = 0
-        while thread.is_alive():
-            line = index - self.offset
-            if line >= 0 and line < self.line_count:
+        while True:
+            with self.activelock:
+                if not self.active:
+                    self.spinner = None
+                    return
                 ch = ('|', '/', '-', '\\')[i % 4]
-                displayqueue.put((self.subwin[1].delch, (line, 0)))
-                displayqueue.put((self.subwin[1].insch, (line, 0, ch)))
+                for index in self.active:
+                    line = index - self.offset
+                    if line >= 0 and line < self.line_count:
+                        displayqueue.put((self.subwin[1].delch, (line, 0)))
+                        displayqueue.put((self.subwin[1].insch, (line, 0, ch)))
                 displayqueue.put((self.subwin[1].noutrefresh, ()))
-                i += 1
-            sleep(.25)
+            i += 1
+            self.done_event.wait(.25)
+            self.done_event.clear()
 
 #~~~ Misc. functions  ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def load_config(cf):
+    """ Return the configuration in file 'cf' as nested dicts.
+    Reuses the copy pickled on a previous run while the file's
+    mtime is unchanged, skipping configobj altogether.
+    """
+    path = os.path.abspath(cf)
+    mtime = os.stat(cf).st_mtime_ns
+    try:
+        with open(config_cache_path, 'rb') as cache:
+            cached = pickle.load(cache)
+        if cached['path'] == path and cached['mtime'] == mtime:
+            return cached['data']
+    except Exception:
+        pass    # missing, stale format or corrupt (pickle can raise
+                #   nearly anything on bad data): just reparse
+    from configobj import ConfigObj as CfgObj
+    config = CfgObj(cf).dict()
+    # it holds api keys, so private to the user; written to a temp
+    # file and renamed so another run never sees half a pickle
+    tmppath = config_cache_path + '.' + str(os.getpid())
+    try:
+        os.makedirs(os.path.dirname(config_cache_path), mode=0o700, exist_ok=True)
+        fd = os.open(tmppath, os.O_WRONLY|os.O_CREAT|os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as cache:
+            pickle.dump({'path':path, 'mtime':mtime, 'data':config}, cache)
+        os.replace(tmppath, config_cache_path)
+    except OSError:
+        try:
+            os.unlink(tmppath)
+        except OSError:
+            pass
+    return config
+
 def config_not_found():
+    from configobj import ConfigObj as CfgObj
     ( txtnorm, txtbold, txtred, txtblue, txtamber, ) = map(lambda s: "\x1b["+s, [ "0m", "1;37m", "1;31m", "1;34m", "33m", ])
     print("Configuration file not found.\n", file=sys.stderr)
     yn = input(f"Would you like to create one? {txtbold}(y/n){txtnorm}: ")
@@ -239,69 +379,74 @@ def config_not_found():
 
 def dispatch_fetch():
     """
-    to be run in a seperate thread
-    which creates another thread,
-    and then calls the spinner routine
+    hand each queued nzb to the fetch pool
+    and start the spinner; doesn't block
     """
-    global  results, listwin, headerwin, totalscreen
-    mx = headerwin.getmaxyx()[1] - 1
-    for idx in range(len(results)):
-        if listwin.selected[idx]:
-            fetch = FetchNZBThread(results[idx])
-            fetch.start()
-            listwin.write_status_spinner(idx, fetch)
-
-            if fetch.success:
-                listwin.fetched[idx] = True
-            listwin.selected[idx] = False
-            displayqueue.put((listwin.write_row, (idx,)))
-            displayqueue.put((listwin.refresh_list, ()))
-
-def monitor_display_queue():
+    global  results, listwin
+    with listwin.activelock:
+        queued = [idx for idx in range(len(results))
+                    if listwin.selected[idx] and idx not in listwin.active]
+    listwin.start_spinner(queued)
+    for idx in queued:
+        future = fetchpool.submit(fetch_nzb, results[idx])
+        future.add_done_callback(lambda f, idx=idx: fetch_done(idx, f))
+
+def fetch_done(idx, future):
     """
-    to be run in a seperate thread
-    from the key input loop,
-    so that they can both be blocking
+    called from the fetch pool as each download finishes
     """
+    global listwin
+    success = future.exception() is None and future.result()
+    with listwin.activelock:
+        listwin.active.discard(idx)
+        if not listwin.active:
+            listwin.done_event.set()    # wake the spinner so it can quit
+        if success:
+            listwin.fetched[idx] = True
+        listwin.selected[idx] = False
+        displayqueue.put((listwin.write_row, (idx,)))
+        displayqueue.put((listwin.refresh_list, ()))
+
+def drain_display_queue():
+    """
+    called from the key input loop, so that
+    only the main thread ever touches curses
+    """
+    drawn = False
     while True:
-        (wfunc, cargs) = displayqueue.get(True) # blocking
-        if len(cargs) > 0:
-            wfunc(*cargs)
-        else:
-            if wfunc == -1:
-                break
-            else:
-                wfunc()
-        curses.doupdate()
+        try:
+            (wfunc, cargs) = displayqueue.get_nowait()
+        except queue.Empty:
+            break
+        wfunc(*cargs)
+        drawn = True
+    if drawn:
+        curses.doupdate()   # once per burst, not per item
 
 def choose_category():
-    global listwin, mainwin, parameters, displaylist
-    categories = []
+    global listwin, headerwin, mainwin, footerwin, parameters, displaylist
 
     listwin = SelectFromListWindow(mainwin, displaylist)
     listwin.draw_window()
     write_status("Retrieving Category List")
 
     capsquery = servers[args.server]['url'] + '/api?' + urlencode({'t':'caps','apikey':servers[args.server]['key']})
-    capsrequest = urlreq.Request(capsquery, headers={'User-Agent':ua})
 
     try:
-        capsresponse = urlreq.urlopen(capsrequest).read().decode()
-        xmlroot = ET.fromstring(capsresponse)
-        qresults = xmlroot.findall('.//category')
-    except (URLError, HTTPError) as e:
-        print("Retrieval Error " + e)
+        capsresponse = httppool.request('GET', capsquery)
+        if capsresponse.status >= 400:
+            raise HTTPError(f"HTTP {capsresponse.status} {capsresponse.reason}")
+        xmlroot = ET.fromstring(capsresponse.data)
+    except HTTPError as e:
+        print("Retrieval Error " + str(e))
         exit(1)
 
-    for cat in qresults:
-        for subcat in cat.iter():
-            d = subcat.attrib
-            d['type'] = subcat.tag
-            categories.append(d)
-            displayline = "{:<4}:  {:<24}".format(d['id'], d['name'])
-            if d['type'] == 'subcat':
-                displayline = ' '*4 + displayline
-            displaylist.append(displayline)
+    catformat = "{:<4}:  {:<24}".format
+    # document order: each category, then its subcats
+    categories = [ dict(cat.attrib, type=cat.tag) for cat in xmlroot.iter()
+                    if cat.tag in ('category', 'subcat') ]
+    displaylist = [ (' '*4 if d['type'] == 'subcat' else '') + catformat(d['id'], d['name'])
+                    for d in categories ]
 
     listwin.new_data(displaylist)
     listwin.draw_list()
@@ -323,21 +468,18 @@ def choose_category():
                 write_status('')
                 return
             elif key == curses.KEY_RESIZE:
-                (headerwin, mainwin, fooerwin) = divide_screen(totalscreen)
-                listwin = SelectFromListWindow(mainwin, displaylist)
-                listwin.draw_window()
+                (headerwin, mainwin, footerwin) = divide_screen(totalscreen)
+                listwin.draw_window()   # same listwin, so selections survive
 
 def human(size):
     """ Return human-readable string for byte size value
     with appropriate suffix.
 
-    Takes a float as input
+    Takes an int (or float) as input
     """
-    for suffix in ['', 'K', 'M', 'G', 'T']:
-        if abs(size) < 1024.0:
-            return "{:3.2f} {:}B".format(size, suffix)
-        size /= 1024
-    return "!!!!!!"  # we ain't doin' Petabyte downloads!
+    n = int(size)
+    i = 0 if n < 1024 else min((n.bit_length() - 1) // 10, 4)  # we ain't doin' Petabyte downloads!
+    return "{:3.2f} {}B".format(size / (1 << (10 * i)), ('', 'K', 'M', 'G', 'T')[i])
 
 #~~~ Background threads  ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 class FetchQueryThread(threading.Thread):
@@ -354,95 +496,147 @@ class FetchQueryThread(threading.Thread):
 
     def run(self):
         #write_status(f"{self.params['q']} from {self.serverurl}")
-        allresults = []
+        # lay out every page up front
+        pages = []
+        offset = self.offset
         remaining = self.limit
-        pgsize = self.pgsize
-        qresults = []
-        # begin = int(self.params['offset'])
-        # page = 0
         while remaining > 0:
-            if remaining < pgsize:
-                self.params['limit'] = remaining        # on the last page
-            self.params['offset'] = str(self.offset)
-            qurl = self.serverurl + '/api?' + urlencode(self.params)
-            qreq = urlreq.Request(qurl, headers={'User-Agent':ua})
-
-            # Fetch
-            try:
-                qresp = urlreq.urlopen(qreq)
-                qoutput = qresp.read().decode()
-            except (URLError, HTTPError) as e:
-                self.success = False
-                self.error = "Fetch Error: " + str(e)
-                exit()
-            except Exception as exc:
-                self.success = False
-                self.error = "WTF: "+str(exc)
-                exit()
-
-            # Parse
-            try:
-                xroot = ET.fromstring(qoutput)
-                qresults = xroot.findall('./channel/item')
-            except ET.ParseError:
-                self.success = False
-                self.error = "ParseError\n"\
-                           + "Server returned non-XML:\n"\
-                           + qoutput
-                exit()
-            except ValueError as ve:
-                self.success = False
-                self.error = "XML error: " + str(ve) + "\n"\
-                           + "Page: " + str(page) + "\n"\
-                           + "Total Results: " + str(len(allresults))
-                exit()
-
-            # Store
-            for result in qresults:
-                item = {}
-                for k in ['title', 'pubDate', 'link', 'category']:
-                    item[k] = result.find(k).text
-                item['size'] = int(result.find('enclosure').get('length'))
-                item['fetched'] = False
-                allresults.append(item)
-
-            if len(qresults) < pgsize:
-                # either that's all there is,
-                # or the limit has been reached
-                break
+            pages.append((offset, min(remaining, self.pgsize)))
+            offset += self.pgsize
+            remaining -= self.pgsize
+        if not pages:
+            self.results = []
+            self.success = True
+            return
 
-            self.offset += pgsize
-            remaining -= pgsize
+        # the first page on its own: it says how many results there are,
+        # so only pages that can hold results get requested after it
+        (first_offset, first_limit) = pages.pop(0)
+        try:
+            (allresults, total) = self._fetch_page(first_offset, first_limit)
+        except Exception as exc:
+            self.error = self.fetch_error(exc)
+            return
+        if len(allresults) < first_limit:
+            # either that's all there is,
+            # or the limit has been reached
+            pages = []
+        elif total is not None:
+            pages = [pg for pg in pages if pg[0] < total]
+
+        if total is None:
+            # server didn't say; walk the rest a page at a time
+            for (offset, limit) in pages:
+                try:
+                    (items, total) = self._fetch_page(offset, limit)
+                except Exception as exc:
+                    self.error = self.fetch_error(exc)
+                    return
+                allresults.extend(items)
+                if len(items) < limit:
+                    break
+        elif pages:
+            with ThreadPoolExecutor(max_workers=min(len(pages), 8)) as pool:
+                futures = [pool.submit(self._fetch_page, *pg) for pg in pages]
+            for (future, (offset, limit)) in zip(futures, pages):
+                try:
+                    (items, total) = future.result()
+                except Exception as exc:
+                    self.error = self.fetch_error(exc)
+                    return
+                allresults.extend(items)
+                if len(items) < limit:
+                    break   # the results are complete; later pages don't matter
         self.results = allresults
         self.success = True
 
-class FetchNZBThread(threading.Thread):
-    global destdir
-
-    def __init__(self, item):
-        self.url = item['link'].replace('&amp;', '&')
-        self.title = item['title']
-        self.destpath = destdir + item['title'] + '.nzb'
-        self.success = False
-        threading.Thread.__init__(self)
-
-    def run(self):
-        displayqueue.put((write_status, (self.title,)))
-        nzbreq = urlreq.Request(self.url, headers={'User-Agent':ua})
+    def fetch_error(self, exc):
+        """ error text for an exception raised by _fetch_page
+        """
+        if isinstance(exc, HTTPError):
+            return "Fetch Error: " + str(exc)
+        if isinstance(exc, ValueError):
+            return str(exc)
+        return "WTF: "+str(exc)
+
+    def _fetch_page(self, offset, limit):
+        """ fetch and parse one page of results,
+        returning a list of item dicts, and the
+        server's total result count (None if not given).
+        the first page, and every page from a server
+        that gives no total, runs on this thread; once
+        the total is known the rest run on page pool
+        workers, so they're parsed in parallel too
+        """
+        params = dict(self.params, offset=str(offset), limit=str(limit))
+        qurl = self.serverurl + '/api?' + urlencode(params)
+
+        # Fetch
+        qresp = httppool.request('GET', qurl)
+        if qresp.status >= 400:
+            raise HTTPError(f"HTTP {qresp.status} {qresp.reason}")
+        qoutput = qresp.data
+
+        # Parse & Store, one <item> at a time
+        items = []
+        total = None
         try:
-            nzb = urlreq.urlopen(nzbreq)
-            with open(self.destpath, 'wb') as nzbfile:
-                nzbfile.write(nzb.read())
-            self.success = True
-            displayqueue.put((write_status, ('',)))
-        except (URLError, HTTPError) as e:
-            displayqueue.put((write_status, (str(e),)))
-            self.success = False
+            for event, result in ET.iterparse(BytesIO(qoutput)):
+                if result.tag == newznab_response:
+                    t = result.get('total', '')
+                    total = int(t) if t.isdigit() else None
+                    continue
+                if result.tag != 'item':
+                    continue
+                item = dict.fromkeys(item_tags, '')     # missing or empty tags
+                item['size'] = 0                        #   mustn't sink the page
+                for child in result:        # one pass over the children
+                    tag = child.tag
+                    if tag in item_tags:
+                        item[tag] = child.text or ''
+                    elif tag == 'enclosure':
+                        item['size'] = int(child.get('length', '0'))
+                item['title'] = item['title'].replace('&amp;', '&')
+                item['link'] = item['link'].replace('&amp;', '&')
+                item['fetched'] = False
+                items.append(item)
+                result.clear()
+        except ET.ParseError:
+            raise ValueError("ParseError\n"\
+                           + "Server returned non-XML:\n"\
+                           + qoutput.decode(errors='replace'))
+        except ValueError as ve:
+            raise ValueError("XML error: " + str(ve) + "\n"\
+                           + "Offset: " + str(offset))
+        return items, total
+
+def fetch_nzb(item):
+    """ Download one nzb into destdir.
+    Runs on the fetch pool; returns True on success
+    """
+    url = item['link']
+    destpath = destdir + item['title'] + '.nzb'
+    displayqueue.put((write_status, (item['title'],)))
+    try:
+        nzb = httppool.request('GET', url, preload_content=False)
+        try:
+            if nzb.status >= 400:
+                raise HTTPError(f"HTTP {nzb.status} {nzb.reason}")
+            with open(destpath, 'wb') as nzbfile:
+                for chunk in nzb.stream(65536):
+                    nzbfile.write(chunk)
+        finally:
+            nzb.release_conn()
+        displayqueue.put((write_status, ('',)))
+        return True
+    except (HTTPError, OSError) as e:
+        displayqueue.put((write_status, (str(e),)))
+        return False
 
 #~~~ Load Configuration ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 for cf in config_file_paths:
     if os.path.isfile(cf):
-        config = CfgObj(cf)
+        config = load_config(cf)
         break
 else:
     config = config_not_found()
@@ -551,9 +745,11 @@ query_string = serverurl + '/api?' + urlencode(parameters)
 write_footer(query_string)
 headerwin.addstr(0, 0, "~~~ Please Wait ", curses.color_pair(2))
 while fetch.is_alive():
+    fetch.join(.25)
     if headerwin.getyx()[1] < (headerwin.getmaxyx()[1] - 1):
-        headerwin.echochar('.', curses.color_pair(2))
-        sleep(.25)
+        headerwin.addch('.', curses.color_pair(2))
+        headerwin.noutrefresh()
+        curses.doupdate()
 
 #~~~ Process Results ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 if not fetch.success:
@@ -571,15 +767,12 @@ if args.alpha:
 if args.reverse:
     results.reverse()
 
-for i in range(len(results)):
-    item = results[i]
-    itemstrings = ['' for i in range(5)]
-    itemstrings[0] = "{:>04d}".format(i+1)                                          # index
-    itemstrings[1] = ' '                                                            # status
-    itemstrings[2] = item['title'].replace('&amp;', '&')                            # title
-    itemstrings[3] = "{:^22}".format(' '.join(item['pubDate'].split(' ')[1:-1]))    # date
-    itemstrings[4] = "{:>10}".format(human(float(item['size'])))                    # size
-    displaylist.append(itemstrings)
+displaylist = [ [ "{:>04d}".format(i+1),                                    # index
+                  ' ',                                                      # status
+                  item['title'],                                            # title
+                  "{:^22}".format(' '.join(item['pubDate'].split(' ')[1:-1])),  # date
+                  "{:>10}".format(human(item['size'])), ]            # size
+                for i, item in enumerate(results) ]
 
 write_header("{:03d} Results returned".format(len(results)), 0)
 write_status(' '.join(args.query))
@@ -590,38 +783,31 @@ write_status("DrawBorder: "+str(listwin.drawborder)+"   LineCount: "+str(listwin
 write_footer("Press 'Q' to quit,  'Space' to queue,  'Enter' to retrieve")
 curses.doupdate()
 
-totalscreen.nodelay(False)
-queuemon = threading.Thread(target = monitor_display_queue)
-queuemon.start()
+totalscreen.timeout(100)    # getch() returns ERR when idle, to drain displayqueue
 
 #~~~ Input Loop ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 while True:
+    drain_display_queue()
     key = totalscreen.getch()
     if key == curses.ERR:
         continue
     handled = listwin.keypress(key)
     if not handled:
         if key in (ord('q'), ord('Q')):
-            displayqueue.put((-1,()))
             break
 
         elif key == ord(' '):
-            count = 0
-            total = 0
-            for idx in range(len(results)):
-                if listwin.selected[idx]:
-                    count += 1
-                    total += results[idx]['size']
+            count = listwin.selected.count(1)
+            total = sum(results[idx]['size'] for idx, sel in enumerate(listwin.selected) if sel)
             displayqueue.put((write_status, (f'{count} items queued.  Total size:  {human(total)}',)))
 
         elif key in (ord('\n'), curses.KEY_ENTER):
-            nzbfetch = threading.Thread(target=dispatch_fetch)
-            nzbfetch.start()
+            dispatch_fetch()
 
         elif key == curses.KEY_RESIZE:
             (headerwin, mainwin, footerwin) = divide_screen(totalscreen)
-            listwin.colwidths = [4, 1, 0, 22, 11]
-            listwin.draw_window()
+            listwin.resize(*mainwin.getmaxyx())
+            listwin.draw_list()
 
         elif key in (ord('r'), ord('R')):
             listwin.draw_list()